@@ -1,17 +1,22 @@
 import calendar
 import csv
+import math
 import sys
 from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from os import path
-from typing import Generator
+from typing import Generator, Iterator
 
-from PySide6.QtCore import Qt, QEvent, QObject, QModelIndex, QAbstractItemModel
+import numpy as np
+from PySide6.QtCore import (
+    Qt, QEvent, QObject, QModelIndex, QAbstractItemModel, QAbstractTableModel, QItemSelection, QTimer
+)
 from PySide6.QtGui import QDoubleValidator, QIcon
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QLabel,
@@ -32,6 +37,241 @@ from PySide6.QtWidgets import (
     QFileDialog
 )
 
+_MONTH_ABBR = tuple(calendar.month_abbr)
+_MONTH_ABBR_INDEX = {abbr: month for month, abbr in enumerate(_MONTH_ABBR)}
+_STRIP_COMMAS = str.maketrans("", "", ",")
+# A balance that rounds to zero cents is paid off; what is left is floating point residue, not a month to pay
+_PAID_OFF_BALANCE = 0.005
+
+# The view queries the model several times per painted cell. PySide6 resolves short enum aliases such as
+# Qt.DisplayRole through a slow fallback (microseconds per lookup), so the hot path uses these instead.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+_ITEM_IS_EDITABLE = Qt.ItemFlag.ItemIsEditable
+
+
+@dataclass(slots=True, frozen=True)
+class Schedule:
+    """
+    An amortization schedule stored as parallel arrays, one element per month, and its total interest.
+
+    Schedules are shared through caches, so they are immutable and their arrays are read-only.
+    """
+
+    month: np.ndarray
+    total: np.ndarray
+    principal: np.ndarray  # Principal from regular payment
+    extra: np.ndarray
+    interest: np.ndarray
+    balance: np.ndarray
+    total_interest: float
+
+    def __post_init__(self) -> None:
+        for arr in (self.month, self.total, self.principal, self.extra, self.interest, self.balance):
+            arr.setflags(write=False)
+
+    def __len__(self) -> int:
+        return len(self.month)
+
+
+def _monthly_payment(principal: float, monthly_rate: float, total_payments: int) -> float:
+    """Calculate the regular monthly payment (excluding extra payments) for a fully amortizing loan."""
+    growth = math.pow(1.0 + monthly_rate, total_payments)
+    return principal * monthly_rate * growth / (growth - 1.0)
+
+
+@lru_cache(maxsize=32)
+def _no_extra_totals(principal_key: int, rate_key: int, years: int) -> tuple[float, float]:
+    """
+    Calculate the totals of a loan without extra payments, which need no schedule.
+
+    The inputs are passed as integer keys so that float noise can't defeat the cache.
+
+    Args:
+        principal_key (int): The loan amount in cents, i.e. round(principal * 100).
+        rate_key (int): The annual interest rate in ten-thousandths of a percent, i.e. round(annual_rate * 10000).
+        years (int): The loan term, in years.
+
+    Returns:
+        Tuple[float, float]: The total interest paid and the total amount paid.
+    """
+    principal = principal_key / 100
+    total_payments = years * 12
+    total_paid = _monthly_payment(principal, rate_key / 10000 / 12 / 100, total_payments) * total_payments
+    return total_paid - principal, total_paid
+
+
+@lru_cache(maxsize=32)
+def _schedule_no_extra(principal: float, monthly_rate: float, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the schedule of a loan without extra payments using the closed-form balance formula.
+
+    The result is cached, so the returned arrays are read-only.
+
+    Args:
+        principal (float): The loan amount.
+        monthly_rate (float): The monthly interest rate, expressed as a fraction.
+        n (int): The number of monthly payments.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The remaining balance, interest payment and principal payment
+        for each month.
+    """
+    monthly_payment = _monthly_payment(principal, monthly_rate, n)
+    # (1 + r) ** k for k = 0..n as a running product: one multiply per month instead of a pow
+    factor = np.full(n + 1, 1 + monthly_rate)
+    factor[0] = 1.0
+    np.multiply.accumulate(factor, out=factor)
+    balance = principal * factor - monthly_payment * (factor - 1) / monthly_rate
+    interest = balance[:-1] * monthly_rate
+    principal_pmt = monthly_payment - interest
+    balance = np.maximum(balance[1:], 0.0)
+    balance[-1] = 0.0  # The last payment retires the loan; drop floating point residue
+    for arr in (balance, interest, principal_pmt):
+        arr.setflags(write=False)
+    return balance, interest, principal_pmt
+
+
+def _amort_loop(
+    principal: float,
+    monthly_rate: float,
+    monthly_payment: float,
+    extra: np.ndarray,
+    out_balance: np.ndarray,
+    out_interest: np.ndarray,
+    out_principal: np.ndarray,
+    out_total: np.ndarray,
+    out_extra: np.ndarray,
+) -> tuple[int, float]:
+    """
+    Run the month-by-month amortization with extra payments, writing each month into the preallocated arrays.
+
+    The loop stops when the loan is paid off (the balance is within _PAID_OFF_BALANCE of zero) or the output
+    arrays are full, whichever comes first.
+
+    Returns:
+        Tuple[int, float]: The number of months written and the interest paid over those months.
+    """
+    balance = principal
+    total_interest = 0.0
+    rows = 0
+
+    for row in range(out_balance.shape[0]):
+        if balance <= _PAID_OFF_BALANCE:
+            break
+        interest = balance * monthly_rate
+        principal_payment = monthly_payment - interest
+        extra_payment = extra[row] if row < extra.shape[0] else 0.0
+        total_payment = monthly_payment + extra_payment
+
+        # Check if the total payment exceeds the remaining balance
+        if total_payment > balance + interest:
+            total_payment = balance + interest
+            principal_payment = balance
+
+        balance -= (principal_payment + extra_payment)
+        total_interest += interest
+
+        out_balance[row] = balance if balance > _PAID_OFF_BALANCE else 0.0
+        out_interest[row] = interest
+        out_principal[row] = principal_payment  # Principal from regular payment
+        out_total[row] = total_payment
+        out_extra[row] = extra_payment
+        rows = row + 1
+
+    return rows, total_interest
+
+
+# The loop used by _schedule_with_extra; swapped for a compiled version by _warm_amort_loop when Numba is installed
+_amort_kernel = _amort_loop
+
+
+def _warm_amort_loop() -> None:
+    """
+    Compile the amortization loop with Numba, if available, so the first calculation doesn't pay the JIT cost.
+
+    Numba is imported here rather than at module level because importing it takes a few hundred milliseconds,
+    which would otherwise delay the window appearing. Frozen builds skip the on-disk cache: PyInstaller's --onefile
+    bundle has no source file for Numba to locate the cache from, so njit(cache=True) would raise.
+    """
+    global _amort_kernel
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional; without it the loop runs as plain Python
+        return
+    kernel = njit(cache=not getattr(sys, "frozen", False))(_amort_loop)
+    out = np.empty((5, 12), dtype=np.float64)
+    kernel(100000.0, 0.005, 8606.64, np.zeros(12, dtype=np.float64), *out)
+    _amort_kernel = kernel
+
+
+def _schedule_with_extra(
+    principal: float, monthly_rate: float, monthly_payment: float, total_payments: int, extra_payments: list[float]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Calculate the schedule of a loan with extra payments.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]: The remaining balance, interest
+        payment, principal payment, total payment and extra payment for each month, and the total interest paid.
+    """
+    extra = np.asarray(extra_payments, dtype=np.float64)
+    # Non-negative extra payments never extend the loan; one spare row absorbs floating point drift.
+    capacity = max(total_payments, extra.shape[0]) + 1
+    while True:
+        out = np.empty((5, capacity), dtype=np.float64)
+        rows, total_interest = _amort_kernel(principal, monthly_rate, monthly_payment, extra, *out)
+        if rows < capacity or out[0, rows - 1] <= 0:
+            break
+        capacity *= 2  # Negative extra payments can outlast the loan term
+
+    balance, interest, principal_pmt, total, extra_pmt = out[:, :rows]
+    return balance, interest, principal_pmt, total, extra_pmt, total_interest
+
+
+def calculate_amortization_table(
+    principal: float, annual_rate: float, years: int, extra_payments: list[float] = None
+) -> Schedule:
+    """
+    Calculate the amortization table, which determines monthly payments, interest, and the remaining balance.
+
+    Args:
+        principal (float): The loan amount.
+        annual_rate (float): The annual interest rate, expressed as a percentage.
+        years (int): The loan term, in years.
+        extra_payments (List[float]): A list of extra payments for each month.
+
+    Returns:
+        Schedule: The amortization schedule, including the total interest paid.
+    """
+    # The cache needs hashable arguments; all-zero extra payments give the same schedule as none
+    extra = tuple(extra_payments) if extra_payments and any(extra_payments) else ()
+    return _cached_amortization_table(principal, annual_rate, years, extra)
+
+
+@lru_cache(maxsize=32)
+def _cached_amortization_table(
+    principal: float, annual_rate: float, years: int, extra_payments: tuple[float, ...]
+) -> Schedule:
+    """Calculate the amortization table for calculate_amortization_table, memoized on its normalized arguments."""
+    monthly_rate = annual_rate / 12 / 100
+    total_payments = years * 12
+    monthly_payment = _monthly_payment(principal, monthly_rate, total_payments)
+
+    if extra_payments:
+        balance, interest, principal_pmt, total, extra, total_interest = _schedule_with_extra(
+            principal, monthly_rate, monthly_payment, total_payments, extra_payments
+        )
+    else:
+        balance, interest, principal_pmt = _schedule_no_extra(principal, monthly_rate, total_payments)
+        total = np.full(total_payments, monthly_payment)
+        extra = np.zeros(total_payments)
+        total_interest = float(interest.sum())
+
+    month = np.arange(1, len(balance) + 1)
+    return Schedule(month, total, principal_pmt, extra, interest, balance, total_interest)
+
 
 class Plan(QWidget):
     """
@@ -41,30 +281,48 @@ class Plan(QWidget):
     DEFAULT_PRINCIPAL = "348300"
     DEFAULT_ANNUAL_RATE = "6.75"
     DEFAULT_YEARS = "30"
+    EXTRA_PAYMENT_RECALC_DELAY_MS = 150
+    SETTINGS_RECALC_DELAY_MS = 15
+
+    # Shared by every plan; created on first use because Qt objects need a running QApplication
+    _PRINCIPAL_VALIDATOR: QDoubleValidator | None = None
+    _ANNUAL_RATE_VALIDATOR: QDoubleValidator | None = None
+    _YEARS_VALIDATOR: QDoubleValidator | None = None
 
     def __init__(self):
         super().__init__()
         self.layout = QVBoxLayout(self)
+        self._error_box: QMessageBox | None = None
+        self._create_validators()
+
+        # The last calculated schedule, kept so that editing one extra payment only recalculates the months after it
+        self._schedule: Schedule | None = None
+        self._schedule_inputs: tuple[float, float, int] | None = None
+        self._pending_extra_row: int | None = None
+
+        # Coalesces the recalculations requested by one settings change, e.g. both radio buttons toggling
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(self.SETTINGS_RECALC_DELAY_MS)
+        self._settings_timer.timeout.connect(self.calculate_amortization)
 
         # Input fields
         self.input_form = QFormLayout()
         self.principal_input = QLineEdit(self.DEFAULT_PRINCIPAL)
-        self.principal_input.setValidator(QDoubleValidator(0.01, 999999999.99, 2))
+        self.principal_input.setValidator(Plan._PRINCIPAL_VALIDATOR)
         
         self.annual_rate_input = QLineEdit(self.DEFAULT_ANNUAL_RATE)
-        annual_rate_validator = QDoubleValidator(0.01, 99.99, 2)
-        annual_rate_validator.setNotation(QDoubleValidator.StandardNotation)
-        self.annual_rate_input.setValidator(annual_rate_validator)
+        self.annual_rate_input.setValidator(Plan._ANNUAL_RATE_VALIDATOR)
         
         self.years_input = QLineEdit(self.DEFAULT_YEARS)
-        self.years_input.setValidator(QDoubleValidator(1, 100, 0)) 
+        self.years_input.setValidator(Plan._YEARS_VALIDATOR)
 
         self.input_form.addRow("Principal ($):", self.principal_input)
         self.input_form.addRow("Annual Interest Rate (%):", self.annual_rate_input)
         self.input_form.addRow("Loan Term (Years):", self.years_input)
         self.layout.addLayout(self.input_form)
         self.start_month_dropdown = QComboBox()
-        self.start_month_dropdown.addItems(["1 (numbered)"] + [calendar.month_abbr[m] for m in range(1, 13)])
+        self.start_month_dropdown.addItems(["1 (numbered)", *_MONTH_ABBR[1:]])
         self.start_month_dropdown.currentIndexChanged.connect(self.update_year_start_visibility)
         self.input_form.addRow("Start Month:", self.start_month_dropdown)
         self.year_start_group = QGroupBox("Year Start")
@@ -77,8 +335,8 @@ class Plan(QWidget):
         self.year_start_layout.addWidget(self.calendar_year_button)
         self.year_start_group.setLayout(self.year_start_layout)
         self.input_form.addRow("", self.year_start_group)
-        self.loan_year_button.toggled.connect(self.calculate_amortization)
-        self.calendar_year_button.toggled.connect(self.calculate_amortization)
+        self.loan_year_button.toggled.connect(self._settings_timer.start)
+        self.calendar_year_button.toggled.connect(self._settings_timer.start)
 
         # Button layout (horizontal)
         self.button_layout = QHBoxLayout()
@@ -120,23 +378,37 @@ class Plan(QWidget):
                                      alignment=Qt.AlignRight)
 
         # Table for amortization schedule
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)  # Setting to 6 columns to match the headers in _display_amortization_table
-        self.table.setHorizontalHeaderLabels(
-            ["Month", "Total Payment", "Principal Payment", "Extra Payment", "Interest Payment", "Remaining Balance"]
-        )
+        self.model = AmortModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         # Set the delegate for the "Extra Payment" column
         currency_delegate = CurrencyDelegate(self.table)
-        self.table.setItemDelegateForColumn(3, currency_delegate)  # Extra Payment column
-        self.table.itemChanged.connect(self.handle_extra_payment_change)
-        self.table.itemSelectionChanged.connect(self.update_sum_of_selected)
+        self.table.setItemDelegateForColumn(AmortModel.EXTRA_PAYMENT_COLUMN, currency_delegate)
+        self.model.dataChanged.connect(self.handle_extra_payment_change)
+        self.table.selectionModel().selectionChanged.connect(self.update_sum_of_selected)
         self.table.horizontalHeader().sectionClicked.connect(self.handle_header_click)
         self.update_row_number_visibility()
         self.layout.addWidget(self.table)
 
+        # Coalesces a burst of extra payment edits into a single recalculation
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(self.EXTRA_PAYMENT_RECALC_DELAY_MS)
+        self._recalc_timer.timeout.connect(self._do_extra_payment_recalc)
+
         self.installEventFilter(self)
 
+    @classmethod
+    def _create_validators(cls) -> None:
+        """Creates the input validators shared by all plans, if they don't exist yet."""
+        if cls._PRINCIPAL_VALIDATOR is not None:
+            return
+        cls._PRINCIPAL_VALIDATOR = QDoubleValidator(0.01, 999999999.99, 2)
+        cls._ANNUAL_RATE_VALIDATOR = QDoubleValidator(0.01, 99.99, 2)
+        cls._ANNUAL_RATE_VALIDATOR.setNotation(QDoubleValidator.StandardNotation)
+        cls._YEARS_VALIDATOR = QDoubleValidator(1, 100, 0)
+
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
         """
         Filters events to handle key presses, particularly the Return key.
@@ -154,25 +426,28 @@ class Plan(QWidget):
         return super().eventFilter(obj, event)
 
     @contextmanager
-    def pause_item_changed_signal(self) -> Generator:
+    def pause_data_changed_signal(self) -> Generator:
         """
-        Context manager to temporarily disconnect the itemChanged signal.
+        Context manager to temporarily disconnect the model's dataChanged signal.
 
         Yields:
             None: Allows the encapsulated block of code to execute without the signal.
         """
-        self.table.itemChanged.disconnect(self.handle_extra_payment_change)
+        self.model.dataChanged.disconnect(self.handle_extra_payment_change)
         try:
             yield
         finally:
-            self.table.itemChanged.connect(self.handle_extra_payment_change)
+            self.model.dataChanged.connect(self.handle_extra_payment_change)
 
     def reset_calculator(self) -> None:
         """Resets the calculator to initial state."""
         self.principal_input.setText(self.DEFAULT_PRINCIPAL)
         self.annual_rate_input.setText(self.DEFAULT_ANNUAL_RATE)
         self.years_input.setText(self.DEFAULT_YEARS)
-        self.table.setRowCount(0)  # Clears the table
+        self.model.clear()  # Clears the table
+        self._schedule = self._schedule_inputs = None
+        self._recalc_timer.stop()
+        self._pending_extra_row = None
         self.start_month_dropdown.setCurrentText("1 (numbered)")
         self.calculate_amortization()
 
@@ -186,7 +461,7 @@ class Plan(QWidget):
         else:
             self.year_start_group.setVisible(True)
         self.update_row_number_visibility()
-        self.calculate_amortization()
+        self._settings_timer.start()
 
     def update_row_number_visibility(self) -> None:
         """Update the visibility of row numbers based on the Start Month setting."""
@@ -203,155 +478,124 @@ class Plan(QWidget):
         Raises:
             ValueError: If input values cannot be converted into the appropriate data types for calculation.
         """
+        # Any pending recalculation is covered by this one, which also picks up the current extra payments
+        self._settings_timer.stop()
+        self._recalc_timer.stop()
+        self._pending_extra_row = None
         try:
-            # Validate inputs
-            try:
-                principal = float(self.principal_input.text().replace(',', ''))
-                if principal <= 0:
-                    raise ValueError("Principal must be a positive number")
-            except ValueError:
-                raise ValueError("Principal must be a valid number")
-                
-            try:
-                annual_rate = float(self.annual_rate_input.text())
-                if annual_rate <= 0:
-                    raise ValueError("Interest rate must be a positive number")
-            except ValueError:
-                raise ValueError("Interest rate must be a valid number")
-                
-            try:
-                years = int(self.years_input.text())
-                if years <= 0:
-                    raise ValueError("Loan term must be a positive integer")
-            except ValueError:
-                raise ValueError("Loan term must be a valid integer")
-
-            extra_payments = self._get_extra_payments(self.table.rowCount())
-
-            amortization, total_interest = self._calculate_amortization_table(
-                principal, annual_rate, years, extra_payments
-            )
-            self._display_amortization_table(amortization)
+            principal, annual_rate, years = self._parse_inputs()
 
-            # Calculate and display "no extra payment" values for comparison
-            amortization_no_extra, total_interest_no_extra = self._calculate_amortization_table(
-                principal, annual_rate, years
-            )
-            total_paid_no_extra = sum(entry['Total Payment'] for entry in amortization_no_extra)
-            
-            # Update totals display
-            total_paid = sum(entry['Total Payment'] for entry in amortization)
-            self.interest_paid_label.setText(f"Interest Paid: ${total_interest:,.2f}")
-            self.total_paid_label.setText(f"Total Paid: ${total_paid:,.2f}")
-            self.interest_no_extra_label.setText(f"Interest Paid (No Extra): ${total_interest_no_extra:,.2f}")
-            self.total_no_extra_label.setText(f"Total Paid (No Extra): ${total_paid_no_extra:,.2f}")
+            extra_payments = self._get_extra_payments()
 
-            self.totals_group_box.setVisible(True)
+            schedule = self._calculate_amortization_table(principal, annual_rate, years, extra_payments)
+            self._schedule, self._schedule_inputs = schedule, (principal, annual_rate, years)
+            self._display_amortization_table(schedule)
+            self.update_totals_display(schedule, principal, annual_rate, years)
 
-            if total_paid_no_extra > 0:
-                self.export_button.setEnabled(True)  # Enable the export button if there are results
-            else:
-                self.export_button.setDisabled(True)
+            # Validated inputs always produce a schedule, so there are results to export
+            self.export_button.setEnabled(True)
 
         except ValueError as e:
-            error_box = QMessageBox()
-            error_box.setIcon(QMessageBox.Critical)
-            error_box.setWindowTitle("Input Error")
-            error_box.setText(str(e))
-            error_box.setStandardButtons(QMessageBox.Ok)
-            error_box.exec()
+            if self._error_box is None:
+                self._error_box = QMessageBox(self)
+                self._error_box.setIcon(QMessageBox.Critical)
+                self._error_box.setWindowTitle("Input Error")
+                self._error_box.setStandardButtons(QMessageBox.Ok)
+            self._error_box.setText(str(e))
+            self._error_box.exec()
             print(f"Invalid input: {e}")
 
+    def _parse_inputs(self) -> tuple[float, float, int]:
+        """
+        Reads and validates the loan inputs.
+
+        Returns:
+            Tuple[float, float, int]: The principal, annual interest rate and loan term in years.
+
+        Raises:
+            ValueError: If an input is not a valid, positive number.
+        """
+        principal_text = self.principal_input.text().translate(_STRIP_COMMAS)
+        annual_rate_text = self.annual_rate_input.text()
+        years_text = self.years_input.text()
+        return (
+            self._require_positive(principal_text, "Principal", float),
+            self._require_positive(annual_rate_text, "Interest rate", float),
+            self._require_positive(years_text, "Loan term", int),
+        )
+
+    @staticmethod
+    def _require_positive(text: str, name: str, convert: type[int] | type[float]) -> int | float:
+        """
+        Converts an input to a number and checks that it is positive.
+
+        Raises:
+            ValueError: If the text is not a number of the given type, or the number is not positive.
+        """
+        try:
+            value = convert(text)
+        except ValueError:
+            raise ValueError(f"{name} must be a valid number") from None
+        if value <= 0:
+            raise ValueError(f"{name} must be a positive number")
+        return value
+
     def _calculate_amortization_table(
         self, principal: float, annual_rate: float, years: int, extra_payments: list[float] = None
-    ) -> tuple[list[dict[str, float]], float]:
+    ) -> Schedule:
+        """Calculate the amortization table; see calculate_amortization_table."""
+        return calculate_amortization_table(principal, annual_rate, years, extra_payments)
+
+    def _recalculate_from(self, start: int, extra_payments: list[float]) -> Schedule:
         """
-        Calculate the amortization table, which determines monthly payments, interest, and the remaining balance.
+        Recalculate the last calculated schedule from month `start` (zero-based) onwards.
 
-        Args:
-            principal (float): The loan amount.
-            annual_rate (float): The annual interest rate, expressed as a percentage.
-            years (int): The loan term, in years.
-            extra_payments (List[float]): A list of extra payments for each month.
+        An extra payment only changes the balance from the month it is made, so the months before `start` are
+        carried over and the loop resumes from the balance left after them.
 
         Returns:
-            Tuple[List[Dict[str, float]], float]: The amortization table and total interest paid.
+            Schedule: The amortization schedule, including the total interest paid.
         """
+        previous = self._schedule
+        principal, annual_rate, years = self._schedule_inputs
         monthly_rate = annual_rate / 12 / 100
         total_payments = years * 12
+        monthly_payment = _monthly_payment(principal, monthly_rate, total_payments)
 
-        # Calculate monthly payment (excluding extra payments)
-        monthly_payment = principal * (monthly_rate * (1 + monthly_rate) ** total_payments) / (
-            (1 + monthly_rate) ** total_payments - 1
+        balance, interest, principal_pmt, total, extra, suffix_interest = _schedule_with_extra(
+            float(previous.balance[start - 1]), monthly_rate, monthly_payment, total_payments - start,
+            extra_payments[start:]
+        )
+        total_interest = previous.total_interest - float(previous.interest[start:].sum()) + suffix_interest
+
+        month = np.arange(1, start + len(balance) + 1)
+        return Schedule(
+            month,
+            np.concatenate((previous.total[:start], total)),
+            np.concatenate((previous.principal[:start], principal_pmt)),
+            np.concatenate((previous.extra[:start], extra)),
+            np.concatenate((previous.interest[:start], interest)),
+            np.concatenate((previous.balance[:start], balance)),
+            total_interest,
         )
-
-        # Initialize variables
-        balance = principal
-        amortization_table = []
-        total_interest = 0.0
-        month = 1
-
-        while balance > 0:
-            interest = balance * monthly_rate
-            principal_payment = monthly_payment - interest
-            extra_payment = extra_payments[month - 1] if extra_payments and month <= len(extra_payments) else 0
-            total_payment = monthly_payment + extra_payment
-
-            # Check if the total payment exceeds the remaining balance
-            if total_payment > balance + interest:
-                total_payment = balance + interest
-                principal_payment = balance
-
-            balance -= (principal_payment + extra_payment)
-            total_interest += interest
-
-            amortization_table.append(
-                {
-                    "Month": month,
-                    "Total Payment": total_payment,
-                    "Principal Payment": principal_payment,  # Principal from regular payment
-                    "Extra Payment": extra_payment,  # Added extra payment column
-                    "Interest Payment": interest,
-                    "Remaining Balance": max(balance, 0),
-                }
-            )
-
-            month += 1
-        # remove potential additional rows from UI table
-        self.table.setRowCount(len(amortization_table))
-
-        return amortization_table, total_interest
 
     def handle_header_click(self, logical_index: int) -> None:
         """
         Handle clicks on the table header.
         If the "Extra Payment" column is clicked, prompt the user for a value and apply it to the entire column.
         """
-        # Column 3 should be "Extra Payment" - matching our header labels
-        if logical_index == 3:  # "Extra Payment" column
+        if logical_index == AmortModel.EXTRA_PAYMENT_COLUMN:
             value, ok = QInputDialog.getDouble(
                 self, "Extra Payment", "Enter extra payment to apply to all rows:", decimals=2
             )
             if ok:
-                for row in range(self.table.rowCount()):
-                    item = self.table.item(row, 3)
-                    if item:
-                        item.setData(Qt.EditRole, value)
-                    else:
-                        new_item = QTableWidgetItem()
-                        new_item.setData(Qt.EditRole, value)
-                        self.table.setItem(row, 3, new_item)
+                with self.pause_data_changed_signal():
+                    self.model.set_extra_payments(value)
+                self._pending_extra_row = 0  # Every month changed
+                self._do_extra_payment_recalc()
 
     def update_sum_of_selected(self) -> None:
-        selected_items = self.table.selectedItems()
-        total_sum = 0.0
-
-        for item in selected_items:
-            try:
-                value = float(item.text().replace(",", ""))
-                total_sum += value
-            except ValueError:
-                pass
+        total_sum = self.model.sum_of(self.table.selectionModel().selection())
 
         if total_sum > 0:
             self.sum_of_selected_label.setText(f"Sum of Selected: ${total_sum:,.2f}")
@@ -359,119 +603,106 @@ class Plan(QWidget):
         else:
             self.sum_of_selected_label.setVisible(False)
 
-    def _get_extra_payments(self, num_rows: int) -> list[float]:
-        """Retrieves extra payments from the table's model data."""
-        extra_payments = [0.0] * num_rows
-        for row in range(num_rows):
-            item = self.table.item(row, 3)  # Index 3 for the "Extra Payment" column
-            if item:
-                try:
-                    extra_payments[row] = float(item.text().replace(",", ""))
-                except ValueError:
-                    pass
-        return extra_payments
-
-    def _display_amortization_table(self, amortization: list[dict[str, float]]) -> None:
+    def _get_extra_payments(self) -> list[float]:
+        """Retrieves extra payments from the table's model data, or an empty list if there are none."""
+        extra_payments = self.model.extra_payments()
+        return extra_payments.tolist() if extra_payments.any() else []
+
+    def _display_amortization_table(self, schedule: Schedule, first_changed_row: int = 0) -> None:
         """
         Display the amortization table in the UI.
 
         Args:
-            amortization (List[Dict[str, float]]): The amortization table to display.
+            schedule (Schedule): The amortization schedule to display.
+            first_changed_row (int): The first month that may differ from the schedule currently displayed.
         """
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(
-            ["Month", "Total Payment", "Principal Payment", "Extra Payment", "Interest Payment", "Remaining Balance"]
+        month_labels = self._month_labels(len(schedule))
+        values = np.column_stack(
+            (schedule.total, schedule.principal, schedule.extra, schedule.interest, schedule.balance)
         )
-        self.table.setRowCount(len(amortization))
-        with self.pause_item_changed_signal():
-            for row_num, entry in enumerate(amortization):
-                month_num = int(entry['Month'])
-                start_month_text = self.start_month_dropdown.currentText()
-
-                if start_month_text != "1 (numbered)":
-                    try:
-                        start_month_num = list(calendar.month_abbr).index(start_month_text)
-                    except ValueError:
-                        start_month_num = 1  # Default to Jan if not found
-
-                    month_name = calendar.month_abbr[(month_num + start_month_num - 2) % 12 + 1]
-                    if self.loan_year_button.isChecked():
-                        year_offset = (month_num - 1) // 12  # Offset based on loan start
-                    elif self.calendar_year_button.isChecked():
-                        year_offset = (month_num + start_month_num - 2) // 12
-                    else:
-                        raise NotImplementedError("Newly added radio button not configured")
-                    month_str = f"{month_name} Y{year_offset + 1}"
-                else:
-                    month_str = str(month_num)
-
-                for col_num, (col_name, value) in enumerate(entry.items()):
-                    if col_name == "Month":
-                        item = self.table.item(row_num, col_num)
-                        if item:
-                            item.setText(month_str)  # Update text if item exists to avoid overwriting
-                        else:
-                            item = QTableWidgetItem(month_str)
-                            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                            self.table.setItem(row_num, col_num, item)
-                    elif col_name == "Extra Payment":
-                        item = QTableWidgetItem()
-                        item.setData(Qt.EditRole, value)  # Use setData for correct formatting
-                        self.table.setItem(row_num, col_num, item)
-                    else:  # Format other numeric data, but not editable
-                        item = QTableWidgetItem(f"{value:,.2f}")
-                        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                        self.table.setItem(row_num, col_num, item)
-
-    def handle_extra_payment_change(self, cell: QTableWidgetItem) -> None:
-        """Handles changes to the 'Extra Payment' column."""
-        if cell.column() != 3:  # Early return if not the "Extra Payment" column
-            return
-        row = cell.row()
-        if row < 0:  # Early return if row index is invalid
+        with self.pause_data_changed_signal():
+            self.model.set_arrays(values, month_labels, first_changed_row)
+
+    def _month_labels(self, num_months: int) -> list[str]:
+        """
+        Build the "Month" column labels according to the start month and year start settings.
+
+        Args:
+            num_months (int): The number of months in the schedule.
+
+        Returns:
+            List[str]: The label for each month.
+        """
+        start_month_text = self.start_month_dropdown.currentText()
+        if start_month_text == "1 (numbered)":
+            return [str(month_num) for month_num in range(1, num_months + 1)]
+
+        start_month_num = _MONTH_ABBR_INDEX.get(start_month_text, 1)  # Default to Jan if not found
+        months = np.arange(num_months)
+        if self.loan_year_button.isChecked():
+            year_offsets = months // 12  # Offset based on loan start
+        elif self.calendar_year_button.isChecked():
+            year_offsets = (months + start_month_num - 1) // 12
+        else:
+            raise NotImplementedError("Newly added radio button not configured")
+        month_nums = (months + start_month_num - 1) % 12 + 1
+        return [
+            f"{_MONTH_ABBR[month_num]} Y{year_offset + 1}"
+            for month_num, year_offset in zip(month_nums.tolist(), year_offsets.tolist())
+        ]
+
+    def handle_extra_payment_change(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: list[int] = ()) -> None:
+        """Handles changes to the 'Extra Payment' column by scheduling a debounced recalculation."""
+        # Early return if the "Extra Payment" column is not part of the change
+        if not top_left.column() <= AmortModel.EXTRA_PAYMENT_COLUMN <= bottom_right.column():
             return
+        row = top_left.row()
+        if self._pending_extra_row is None or row < self._pending_extra_row:
+            self._pending_extra_row = row
+        self._recalc_timer.start()
+
+    def _do_extra_payment_recalc(self) -> None:
+        """Recalculates the amortization with the current extra payments."""
+        self._recalc_timer.stop()
+        start = self._pending_extra_row or 0
+        self._pending_extra_row = None
         try:
-            with self.pause_item_changed_signal():
-                principal = float(self.principal_input.text())
-                annual_rate = float(self.annual_rate_input.text())
-                years = int(self.years_input.text())
-
-                extra_payments = self._get_extra_payments(self.table.rowCount())  # Retrieve fresh extra payments.
-                amortization, total_interest = self._calculate_amortization_table(principal, annual_rate, years,
-                                                                                  extra_payments)
-                # Update only the necessary cells in the table
-                for row_index, entry in enumerate(amortization):  # Use the correct row index
-                    for col_index, (col_name, value) in enumerate(entry.items()):
-                        # the Month and Extra Payment, which is user-entered,
-                        if col_name in {"Month", "Extra Payment"}:
-                            continue
-                        item = self.table.item(row_index, col_index)
-                        if item:
-                            item.setText(f"{value:,.2f}")
-                        else:
-                            new_item = QTableWidgetItem(f"{value:,.2f}")
-                            new_item.setFlags(
-                                new_item.flags() & ~Qt.ItemIsEditable)
-                            self.table.setItem(row_index, col_index, new_item)
-                self.update_totals_display(amortization, total_interest, principal, annual_rate, years)
+            principal, annual_rate, years = self._parse_inputs()
+            inputs = (principal, annual_rate, years)
+
+            extra_payments = self._get_extra_payments()  # Retrieve fresh extra payments.
+            if (
+                0 < start < len(self._schedule or ())
+                and inputs == self._schedule_inputs
+                and any(extra_payments)
+            ):
+                # The months before the earliest edited one are unchanged
+                schedule = self._recalculate_from(start, extra_payments)
+            else:
+                schedule = self._calculate_amortization_table(principal, annual_rate, years, extra_payments)
+                start = 0
+            self._schedule, self._schedule_inputs = schedule, inputs
+            self._display_amortization_table(schedule, start)
+            self.update_totals_display(schedule, principal, annual_rate, years)
         except ValueError:
             pass
 
     def update_totals_display(
             self,
-            amortization: list[dict[str, float]],
-            total_interest: float,
+            schedule: Schedule,
             principal: float,
             annual_rate: float,
             years: int
     ) -> None:
-        total_paid = sum(entry['Total Payment'] for entry in amortization)
-        self.interest_paid_label.setText(f"Interest Paid: ${total_interest:,.2f}")
+        """Shows the totals of the schedule next to the totals of the same loan without extra payments."""
+        total_paid = float(schedule.total.sum())
+        self.interest_paid_label.setText(f"Interest Paid: ${schedule.total_interest:,.2f}")
         self.total_paid_label.setText(f"Total Paid: ${total_paid:,.2f}")
 
         # Calculate and display "no extra payment" values for comparison.
-        amortization_no_extra, total_interest_no_extra = self._calculate_amortization_table(principal, annual_rate, years)
-        total_paid_no_extra = sum(entry['Total Payment'] for entry in amortization_no_extra)
+        total_interest_no_extra, total_paid_no_extra = _no_extra_totals(
+            round(principal * 100), round(annual_rate * 10000), years
+        )
         self.interest_no_extra_label.setText(f"Interest Paid (No Extra): ${total_interest_no_extra:,.2f}")
         self.total_no_extra_label.setText(f"Total Paid (No Extra): ${total_paid_no_extra:,.2f}")
 
@@ -479,7 +710,7 @@ class Plan(QWidget):
 
     def export_to_csv(self) -> None:
         """Export the amortization schedule to a CSV file."""
-        if self.table.rowCount() == 0:
+        if self.model.rowCount() == 0:
             QMessageBox.warning(self, "No Data", "There is no data to export. Please calculate an amortization schedule first.")
             return
             
@@ -494,7 +725,7 @@ class Plan(QWidget):
             file_name += '.csv'
 
         try:
-            with open(file_name, mode='w', newline='') as csv_file:
+            with open(file_name, mode='w', newline='', buffering=1 << 20) as csv_file:
                 writer = csv.writer(csv_file)
 
                 # Write loan details as header information
@@ -514,37 +745,173 @@ class Plan(QWidget):
                     writer.writerow([])  # Empty row for separation
 
                 # Write headers
-                headers = []
-                for col in range(self.table.columnCount()):
-                    headers.append(self.table.horizontalHeaderItem(col).text())
-                writer.writerow(headers)
+                writer.writerow(AmortModel.HEADERS)
 
                 # Write amortization rows
-                for row_index in range(self.table.rowCount()):
-                    row_data = []
-                    for col in range(self.table.columnCount()):
-                        cell = self.table.item(row_index, col)
-                        row_data.append(cell.text() if cell else "")
-                    writer.writerow(row_data)
+                writer.writerows(self.model.formatted_rows())
 
             QMessageBox.information(self, "Export Successful", f"Amortization schedule exported successfully to {file_name}")
         except Exception as e:
             QMessageBox.critical(self, "Export Error", f"Failed to export data: {str(e)}")
 
 
+class AmortModel(QAbstractTableModel):
+    """
+    Table model for an amortization schedule, backed by a NumPy array.
+
+    Cells are formatted lazily in data(), so only the rows the view actually paints are formatted.
+    """
+
+    HEADERS = ("Month", "Total Payment", "Principal Payment", "Extra Payment", "Interest Payment", "Remaining Balance")
+    EXTRA_PAYMENT_COLUMN = 3
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        # One row per month; the columns follow HEADERS without the "Month" column.
+        self._arr = np.empty((0, 5), dtype=np.float64)
+        self._month_labels: list[str] = []
+
+    def set_arrays(self, values: np.ndarray, month_labels: list[str], first_changed_row: int = 0) -> None:
+        """
+        Replace the schedule shown by the model.
+
+        Existing rows are updated in place and only the difference in length is inserted or removed, so the view
+        keeps its selection, current cell and scroll position.
+
+        Args:
+            values (np.ndarray): The numeric columns, with shape (months, 5).
+            month_labels (List[str]): The label displayed in the "Month" column for each row.
+            first_changed_row (int): The first row that may differ from the current schedule; the view is only told
+                to repaint from here on.
+        """
+        old_rows, new_rows = len(self._month_labels), len(month_labels)
+        if new_rows < old_rows:
+            self.beginRemoveRows(QModelIndex(), new_rows, old_rows - 1)
+            self._arr, self._month_labels = values, month_labels
+            self.endRemoveRows()
+        elif new_rows > old_rows:
+            self.beginInsertRows(QModelIndex(), old_rows, new_rows - 1)
+            self._arr, self._month_labels = values, month_labels
+            self.endInsertRows()
+        else:
+            self._arr, self._month_labels = values, month_labels
+
+        kept_rows = min(old_rows, new_rows)
+        if first_changed_row < kept_rows:
+            self.dataChanged.emit(
+                self.index(first_changed_row, 0),
+                self.index(kept_rows - 1, len(self.HEADERS) - 1),
+                [_DISPLAY_ROLE, _EDIT_ROLE],
+            )
+
+    def clear(self) -> None:
+        """Remove all rows from the model."""
+        self.set_arrays(np.empty((0, 5), dtype=np.float64), [])
+
+    def extra_payments(self) -> np.ndarray:
+        """Returns a copy of the extra payment for each month."""
+        return self._arr[:, self.EXTRA_PAYMENT_COLUMN - 1].copy()
+
+    def set_extra_payments(self, value: float) -> None:
+        """Apply the same extra payment to every month."""
+        if not self._month_labels:
+            return
+        self._arr[:, self.EXTRA_PAYMENT_COLUMN - 1] = value
+        self.dataChanged.emit(
+            self.index(0, self.EXTRA_PAYMENT_COLUMN),
+            self.index(len(self._month_labels) - 1, self.EXTRA_PAYMENT_COLUMN),
+            [Qt.DisplayRole, Qt.EditRole],
+        )
+
+    def sum_of(self, selection: QItemSelection) -> float:
+        """
+        Sum the numeric cells covered by a selection, one array slice per selection range.
+
+        Args:
+            selection (QItemSelection): The selected ranges; the "Month" column is ignored.
+
+        Returns:
+            float: The sum of the selected values.
+        """
+        total = 0.0
+        for selection_range in selection:
+            # View columns 1..5 map to array columns 0..4; slicing from column 0 drops "Month".
+            total += self._arr[
+                selection_range.top():selection_range.bottom() + 1,
+                max(selection_range.left() - 1, 0):selection_range.right(),
+            ].sum()
+        return float(total)
+
+    def formatted_rows(self) -> Iterator[tuple[str, ...]]:
+        """Yields each row as it is displayed in the table, straight from the underlying arrays."""
+        for month_label, (total, principal, extra, interest, balance) in zip(self._month_labels, self._arr.tolist()):
+            yield (month_label, f"{total:,.2f}", f"{principal:,.2f}", f"{extra:,.2f}",
+                   f"{interest:,.2f}", f"{balance:,.2f}")
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._month_labels)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE) -> str | float | None:
+        # The view asks for several roles per painted cell; only these two carry data.
+        if (role != _DISPLAY_ROLE and role != _EDIT_ROLE) or not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            return self._month_labels[row] if role == _DISPLAY_ROLE else None
+        if role == _DISPLAY_ROLE:
+            return f"{self._arr.item(row, col - 1):,.2f}"  # A Python float formats faster than a NumPy scalar
+        if col == self.EXTRA_PAYMENT_COLUMN:
+            return self._arr.item(row, col - 1)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY_ROLE) -> str | None:
+        if orientation == _HORIZONTAL and role == _DISPLAY_ROLE:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if index.column() == self.EXTRA_PAYMENT_COLUMN:
+            flags |= _ITEM_IS_EDITABLE
+        return flags
+
+    def setData(self, index: QModelIndex, value: str | float, role: int = Qt.EditRole) -> bool:
+        if role != Qt.EditRole or index.column() != self.EXTRA_PAYMENT_COLUMN:
+            return False
+        try:
+            extra_payment = float(str(value).replace(",", ""))
+        except ValueError:
+            extra_payment = 0.0  # An empty cell clears the extra payment
+        self._arr[index.row(), self.EXTRA_PAYMENT_COLUMN - 1] = extra_payment
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+
 class CurrencyDelegate(QStyledItemDelegate):
+    # Shared by every editor; created on first use because Qt objects need a running QApplication
+    _VALIDATOR: QDoubleValidator | None = None
+
     def __init__(self, parent: QWidget | None=None):
         super().__init__(parent)
 
+    @classmethod
+    def _make_validator(cls) -> QDoubleValidator:
+        """Returns the validator shared by all editors, creating it on first use."""
+        if cls._VALIDATOR is None:
+            cls._VALIDATOR = QDoubleValidator(0.0, float('inf'), 2)
+            cls._VALIDATOR.setNotation(QDoubleValidator.StandardNotation)
+        return cls._VALIDATOR
+
     def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
         editor = QLineEdit(parent)
-        validator = QDoubleValidator(0.0, float('inf'), 2, editor)
-        validator.setNotation(QDoubleValidator.StandardNotation)
-        editor.setValidator(validator)
+        editor.setValidator(self._make_validator())
         return editor
 
     def setEditorData(self, editor: QLineEdit, index: QModelIndex) -> None:
-        value = index.model().data(index, Qt.DisplayRole)
+        value = index.model().data(index, Qt.EditRole)
         editor.setText(str(value))
 
     def setModelData(self, editor: QLineEdit, model: QAbstractItemModel, index: QModelIndex) -> None:
@@ -559,13 +926,18 @@ class AmortizationCalculator(QMainWindow):
     """
     VERSION = "0.2.0"
 
+    # Decoded once on first use because Qt objects need a running QApplication
+    _ICON: QIcon | None = None
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"Morty v{self.VERSION} (your friendly amortization calculator)")
         self.setGeometry(100, 100, 800, 1100)
-        bundle_dir = path.abspath(path.dirname(__file__))
-        icon_path = path.join(bundle_dir, "friendly.ico")  # path when bundled by PyInstaller
-        self.setWindowIcon(QIcon(icon_path))
+        if AmortizationCalculator._ICON is None:
+            bundle_dir = path.abspath(path.dirname(__file__))
+            icon_path = path.join(bundle_dir, "friendly.ico")  # path when bundled by PyInstaller
+            AmortizationCalculator._ICON = QIcon(icon_path)
+        self.setWindowIcon(AmortizationCalculator._ICON)
 
         # Main widget and layout
         self.main_widget = QWidget()
@@ -596,6 +968,9 @@ class AmortizationCalculator(QMainWindow):
         # Add the first tab
         self.add_tab()
 
+        # Compile the amortization loop once the event loop starts, while the window is being shown
+        QTimer.singleShot(0, _warm_amort_loop)
+
     def add_tab(self) -> None:
         """Adds a new tab with a Plan widget."""
         new_plan = Plan()
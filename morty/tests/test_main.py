@@ -1,116 +1,151 @@
 import sys
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
-from PySide6.QtCore import Qt, QModelIndex
+from PySide6.QtCore import Qt, QItemSelection, QModelIndex
 from PySide6.QtGui import QDoubleValidator, QValidator
-from PySide6.QtWidgets import QApplication, QLineEdit, QTableWidgetItem
+from PySide6.QtWidgets import QLineEdit
+
+from morty.main import (
+    Plan, AmortModel, CurrencyDelegate, AmortizationCalculator, Schedule, calculate_amortization_table,
+    _monthly_payment, _no_extra_totals, _schedule_no_extra, _schedule_with_extra, _warm_amort_loop,
+)
+
+EMPTY_SCHEDULE = Schedule(*(np.empty(0) for _ in range(6)), total_interest=0.0)
+BASELINE_YEARS = 10
+BASELINE_LOAN = (10000, 6, BASELINE_YEARS)  # Principal, annual rate and years
+# Extra payments as tuples, built once and hashable so repeated calculations hit the schedule cache
+ZERO_EXTRA_1Y = (0,) * 13
+BASELINE_EXTRAS = [(amount,) * (BASELINE_YEARS * 12 + 2) for amount in (25, 100, 1000)]
+# Each loan input and the Plan constant holding its default text
+DEFAULT_INPUTS = [
+    ("principal_input", "DEFAULT_PRINCIPAL"),
+    ("annual_rate_input", "DEFAULT_ANNUAL_RATE"),
+    ("years_input", "DEFAULT_YEARS"),
+]
+
+
+@contextmanager
+def _silence(obj, name):
+    """Replace a method with a no-op for the duration of the block; cheaper than patch when calls aren't checked."""
+    own = vars(obj).get(name)  # Usually None: the method lives on the class
+    setattr(obj, name, lambda *args, **kwargs: None)
+    try:
+        yield
+    finally:
+        if own is None:
+            delattr(obj, name)
+        else:
+            setattr(obj, name, own)
+
+
+@pytest.fixture(scope="module")
+def baseline_schedule():
+    """Fixture providing the schedule of the baseline loan without extra payments, calculated once per module."""
+    return calculate_amortization_table(*BASELINE_LOAN)
+
+
+@pytest.fixture(scope="class")
+def shared_plan(qapp):
+    """Fixture providing a Plan reused by every test in a class, since building its widgets dominates a test."""
+    return Plan()
 
-from morty.main import Plan, CurrencyDelegate, AmortizationCalculator
 
 @pytest.fixture
-def app():
-    """Fixture providing a QApplication instance for tests."""
-    if not QApplication.instance():
-        app = QApplication(sys.argv)
-    else:
-        app = QApplication.instance()
-    yield app
+def plan(shared_plan):
+    """Fixture providing the class's shared Plan, restored to its defaults after each test."""
+    yield shared_plan
+    with _silence(shared_plan, 'calculate_amortization'):
+        shared_plan.reset_calculator()
+    shared_plan.loan_year_button.setChecked(True)
+    shared_plan._settings_timer.stop()
+    shared_plan._recalc_timer.stop()
+    shared_plan._pending_extra_row = None
+
+
+@pytest.fixture(scope="class")
+def shared_calc(qapp):
+    """Fixture providing a calculator window reused by every test in a class."""
+    return AmortizationCalculator()
+
+
+@pytest.fixture
+def calc(shared_calc):
+    """Fixture providing the class's shared calculator, with any tabs a test added closed afterwards."""
+    initial_count = shared_calc.tab_widget.count()
+    yield shared_calc
+    while shared_calc.tab_widget.count() > initial_count:
+        shared_calc.close_tab(shared_calc.tab_widget.count() - 1)
 
 
 class TestPlan:
-    def test_init_default_values(self, app):
-        """Test that Plan initializes with default values."""
-        plan = Plan()
-        assert plan.principal_input.text() == Plan.DEFAULT_PRINCIPAL
-        assert plan.annual_rate_input.text() == Plan.DEFAULT_ANNUAL_RATE
-        assert plan.years_input.text() == Plan.DEFAULT_YEARS
+    @pytest.mark.parametrize("field, default", DEFAULT_INPUTS)
+    def test_init_default_values(self, plan, field, default):
+        """Test that Plan initializes each loan input with its default value."""
+        assert getattr(plan, field).text() == getattr(Plan, default)
+
+    def test_init_default_settings(self, plan):
+        """Test that Plan initializes with numbered months counted from the loan start."""
         assert plan.start_month_dropdown.currentText() == "1 (numbered)"
         assert plan.loan_year_button.isChecked() is True
         assert plan.calendar_year_button.isChecked() is False
 
-    def test_reset_calculator(self, app):
+    def test_plans_share_validators(self, qtbot):
+        """Test that input validators are created once and shared between plans."""
+        first, second = Plan(), Plan()
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+        assert first.principal_input.validator() is second.principal_input.validator()
+        assert first.years_input.validator() is second.years_input.validator()
+
+    @pytest.mark.parametrize("field, default", DEFAULT_INPUTS)
+    def test_reset_calculator(self, plan, field, default):
         """Test the reset_calculator method resets values to defaults."""
-        plan = Plan()
-        # Set custom values
-        plan.principal_input.setText("100000")
-        plan.annual_rate_input.setText("5.0")
-        plan.years_input.setText("15")
+        getattr(plan, field).setText("15")  # Set a custom value
         
-        with patch.object(plan, 'calculate_amortization'):
+        with _silence(plan, 'calculate_amortization'):
             plan.reset_calculator()
         
-        assert plan.principal_input.text() == Plan.DEFAULT_PRINCIPAL
-        assert plan.annual_rate_input.text() == Plan.DEFAULT_ANNUAL_RATE
-        assert plan.years_input.text() == Plan.DEFAULT_YEARS
+        assert getattr(plan, field).text() == getattr(Plan, default)
 
-    def test_calculate_amortization_table(self, app):
-        """Test the amortization calculation logic."""
-        plan = Plan()
-        
-        # Set test values
-        principal = 1000
-        annual_rate = 12
-        years = 1
-        extra_payments = [0] * 13
-        
-        with patch.object(plan.table, 'setRowCount'):
-            amortization, total_interest = plan._calculate_amortization_table(
-                principal, annual_rate, years, extra_payments
-            )
-        
-        # Verify calculation results
-        assert len(amortization) in (12, 13)
-        assert round(total_interest, 2) > 0
-        assert round(amortization[-1]["Remaining Balance"], 2) == 0.0
-        
-        monthly_rate = annual_rate / 12 / 100
-        expected_monthly_payment = principal * (monthly_rate * (1 + monthly_rate) ** 12) / ((1 + monthly_rate) ** 12 - 1)
-        
-        assert round(amortization[0]["Total Payment"], 2) == round(expected_monthly_payment, 2)
+    @pytest.mark.parametrize("field, text, message", [
+        ("principal_input", "0", "Principal must be a positive number"),
+        ("annual_rate_input", "abc", "Interest rate must be a valid number"),
+        ("years_input", "7.5", "Loan term must be a valid number"),
+    ])
+    def test_parse_inputs_rejects_invalid_values(self, plan, field, text, message):
+        """Test that invalid inputs are reported by name."""
+        getattr(plan, field).setText(text)
 
-    def test_extra_payments_calculation(self, app):
-        """Test that extra payments reduce the loan term and interest."""
-        plan = Plan()
-        
-        # Set test values
-        principal = 10000
-        annual_rate = 6
-        years = 10
-        
-        with patch.object(plan.table, 'setRowCount'):
-            amortization_no_extra, total_interest_no_extra = plan._calculate_amortization_table(
-                principal, annual_rate, years
-            )
-            
-            # Add $100 extra payment to each month
-            extra_payments = [100] * (years * 12 + 2)
-            amortization_with_extra, total_interest_with_extra = plan._calculate_amortization_table(
-                principal, annual_rate, years, extra_payments
-            )
-        
-        # Extra payments should reduce both loan length and total interest
-        assert len(amortization_with_extra) < len(amortization_no_extra)
-        assert total_interest_with_extra < total_interest_no_extra
+        with pytest.raises(ValueError, match=message):
+            plan._parse_inputs()
+
+    def test_parse_inputs_strips_grouping(self, plan):
+        """Test that thousands separators in the principal are accepted."""
+        plan.principal_input.setText("348,300")
+
+        assert plan._parse_inputs() == (348300.0, float(Plan.DEFAULT_ANNUAL_RATE), int(Plan.DEFAULT_YEARS))
 
     @patch('morty.main.Plan.update_totals_display')
-    def test_calculate_amortization_method(self, mock_update_totals, app):
+    def test_calculate_amortization_method(self, mock_update_totals, plan):
         """Test the calculate_amortization method using mocks."""
-        plan = Plan()
         plan.principal_input.setText("10000")
         plan.annual_rate_input.setText("5.0")
         plan.years_input.setText("10")
         
-        # Updated patch to handle two calls to _calculate_amortization_table
         with patch.object(plan, '_get_extra_payments', return_value=[]) as mock_get_extra, \
-             patch.object(plan, '_calculate_amortization_table', side_effect=[([], 0.0), ([], 0.0)]) as mock_calculate, \
+             patch.object(plan, '_calculate_amortization_table', return_value=EMPTY_SCHEDULE) as mock_calculate, \
              patch.object(plan, '_display_amortization_table') as mock_display, \
              patch('morty.main.QMessageBox'), \
              patch.object(plan.export_button, 'setEnabled') as mock_set_enabled:
             
             plan.calculate_amortization()
             
-            # Now it should be called twice - once for with extra payments, once for without
-            assert mock_calculate.call_count == 2
+            # The "no extra" totals are closed-form, so only the schedule itself is calculated
+            assert mock_calculate.call_count == 1
             
             # Check first call arguments
             first_call_args = mock_calculate.call_args_list[0][0]
@@ -119,30 +154,290 @@ class TestPlan:
             assert first_call_args[2] == 10
             
             mock_display.assert_called_once()
+            mock_update_totals.assert_called_once_with(EMPTY_SCHEDULE, 10000.0, 5.0, 10)
+            mock_set_enabled.assert_called_once_with(True)
+
+    def test_extra_payment_edit_recalculates(self, plan):
+        """Test that editing an extra payment in the model shortens the schedule."""
+        plan.calculate_amortization()
+        rows_before = plan.model.rowCount()
+
+        plan.model.setData(plan.model.index(0, AmortModel.EXTRA_PAYMENT_COLUMN), "50000")
+        assert plan._recalc_timer.isActive()
+        assert plan.model.rowCount() == rows_before  # Recalculation is debounced
+        plan._recalc_timer.timeout.emit()
+
+        assert plan.model.rowCount() < rows_before
+        assert plan.model.index(0, AmortModel.EXTRA_PAYMENT_COLUMN).data(Qt.EditRole) == 50000.0
+
+    def test_settings_changes_recalculate_once(self, plan):
+        """Test that switching the year start, which toggles both radio buttons, is coalesced into one calculation."""
+
+        with patch.object(plan, '_calculate_amortization_table', return_value=EMPTY_SCHEDULE) as mock_calculate, \
+             _silence(plan, '_display_amortization_table'):
+            plan.calendar_year_button.setChecked(True)
+            assert plan._settings_timer.isActive()
+            assert mock_calculate.call_count == 0
+            plan._settings_timer.timeout.emit()
+
+            assert mock_calculate.call_count == 1
+            assert not plan._settings_timer.isActive()
+
+    def test_get_extra_payments_is_empty_without_extras(self, plan):
+        """Test that a schedule without extra payments reports none, and an edited one reports every month."""
+        plan.calculate_amortization()
+        assert plan._get_extra_payments() == []
+
+        plan.model.setData(plan.model.index(1, AmortModel.EXTRA_PAYMENT_COLUMN), "100")
+        extra_payments = plan._get_extra_payments()
+        assert len(extra_payments) == plan.model.rowCount()
+        assert extra_payments[:3] == [0.0, 100.0, 0.0]
+
+    def test_recalculation_keeps_selection(self, plan):
+        """Test that recalculating updates rows in place instead of resetting the view."""
+        plan.calculate_amortization()
+        plan.table.selectRow(2)
+
+        plan.model.setData(plan.model.index(0, AmortModel.EXTRA_PAYMENT_COLUMN), "1000")
+        plan._recalc_timer.timeout.emit()
+
+        assert {index.row() for index in plan.table.selectionModel().selectedIndexes()} == {2}
+
+    def test_late_edit_matches_full_recalculation(self, plan):
+        """Test that recalculating from the edited month gives the same schedule as starting over."""
+        plan.calculate_amortization()
+        plan.model.setData(plan.model.index(24, AmortModel.EXTRA_PAYMENT_COLUMN), "1000")
+        plan.model.setData(plan.model.index(12, AmortModel.EXTRA_PAYMENT_COLUMN), "500")
+        assert plan._pending_extra_row == 12
+        plan._recalc_timer.timeout.emit()
+
+        expected = calculate_amortization_table(348300.0, 6.75, 30, plan._get_extra_payments())
+        assert len(plan._schedule) == len(expected)
+        assert np.allclose(plan._schedule.balance, expected.balance)
+        assert plan._schedule.total_interest == pytest.approx(expected.total_interest, abs=1e-2)
+
+    def test_calculate_cancels_pending_extra_payment_recalc(self, plan):
+        """Test that a full calculation drops a pending partial recalculation that could outlast the schedule."""
+        plan.calculate_amortization()
+        plan.model.setData(plan.model.index(50, AmortModel.EXTRA_PAYMENT_COLUMN), "100")
+        plan._recalc_timer.timeout.emit()
+
+        plan.years_input.setText("10")
+        plan.model.setData(plan.model.index(300, AmortModel.EXTRA_PAYMENT_COLUMN), "100")
+        plan.calculate_amortization()  # Pressed before the debounce fires
+
+        assert not plan._recalc_timer.isActive()
+        assert plan._pending_extra_row is None
+        assert plan.model.rowCount() <= 120
+
+        # A stale row past the end of the schedule falls back to a full recalculation
+        plan._pending_extra_row = 300
+        plan._do_extra_payment_recalc()
+        assert len(plan._schedule) == plan.model.rowCount()
+
+    def test_month_labels(self, plan):
+        """Test month labels for numbered, loan-year and calendar-year starts."""
+        assert plan._month_labels(3) == ["1", "2", "3"]
+
+        plan.start_month_dropdown.setCurrentText("Nov")
+        plan.loan_year_button.setChecked(True)
+        labels = plan._month_labels(14)
+        assert labels[:3] == ["Nov Y1", "Dec Y1", "Jan Y1"]
+        assert labels[12:] == ["Nov Y2", "Dec Y2"]
+
+        plan.calendar_year_button.setChecked(True)
+        assert plan._month_labels(3) == ["Nov Y1", "Dec Y1", "Jan Y2"]
+
+
+class TestCalculateAmortizationTable:
+    def test_calculate_amortization_table(self):
+        """Test the amortization calculation logic."""
+        
+        # Set test values
+        principal = 1000
+        annual_rate = 12
+        years = 1
+        extra_payments = ZERO_EXTRA_1Y
+        
+        schedule = calculate_amortization_table(principal, annual_rate, years, extra_payments)
+        
+        # Verify calculation results
+        assert len(schedule) == 12
+        assert schedule.total_interest > 0
+        assert schedule.balance[-1] == pytest.approx(0.0, abs=1e-2)
+        
+        monthly_rate = annual_rate / 12 / 100
+        expected_monthly_payment = principal * (monthly_rate * (1 + monthly_rate) ** 12) / ((1 + monthly_rate) ** 12 - 1)
+        
+        assert schedule.total[0] == pytest.approx(expected_monthly_payment, abs=1e-2)
+
+    @pytest.mark.parametrize("extra_payments", BASELINE_EXTRAS, ids=lambda extras: f"extra={extras[0]}")
+    def test_extra_payments_calculation(self, baseline_schedule, extra_payments):
+        """Test that extra payments reduce the loan term and interest."""
+        
+        # The same extra payment is added to each month of the baseline loan
+        schedule_with_extra = calculate_amortization_table(*BASELINE_LOAN, extra_payments)
+        
+        # Extra payments should reduce both loan length and total interest
+        assert len(schedule_with_extra) < len(baseline_schedule)
+        assert schedule_with_extra.total_interest < baseline_schedule.total_interest
+
+
+    def test_results_are_cached_and_read_only(self):
+        """Test that equal inputs share one immutable schedule, whether extras are a list, a tuple or all zero."""
+        schedule = calculate_amortization_table(*BASELINE_LOAN, [100] * 12)
+
+        assert calculate_amortization_table(*BASELINE_LOAN, (100,) * 12) is schedule
+        assert calculate_amortization_table(*BASELINE_LOAN, [0] * 12) is calculate_amortization_table(*BASELINE_LOAN)
+        with pytest.raises(ValueError):
+            schedule.balance[0] = 0.0
+
+
+class TestNoExtraTotals:
+    def test_matches_schedule(self):
+        """Test that the closed-form totals match the summed schedule."""
+        schedule = calculate_amortization_table(250000, 5.5, 30)
+
+        interest, total_paid = _no_extra_totals(25000000, 55000, 30)
+
+        assert total_paid == pytest.approx(schedule.total.sum())
+        assert interest == pytest.approx(schedule.total_interest)
+
+
+class TestScheduleNoExtra:
+    @pytest.mark.parametrize("principal, annual_rate, years", [(348300, 6.75, 30), (1000, 0.5, 1), (90000, 12, 15)])
+    def test_matches_month_by_month_loop(self, principal, annual_rate, years):
+        """Test that the closed-form schedule matches the amortization loop with no extra payments."""
+        monthly_rate = annual_rate / 12 / 100
+        total_payments = years * 12
+        monthly_payment = _monthly_payment(principal, monthly_rate, total_payments)
+
+        balance, interest, principal_pmt = _schedule_no_extra(principal, monthly_rate, total_payments)
+        loop_balance, loop_interest, loop_principal, _, _, _ = _schedule_with_extra(
+            principal, monthly_rate, monthly_payment, total_payments, [0.0] * total_payments
+        )
+
+        assert len(balance) == len(loop_balance) == total_payments
+        assert np.allclose(interest, loop_interest)
+        assert np.allclose(principal_pmt, loop_principal)
+        assert np.allclose(balance, loop_balance, atol=1e-6)
+
+
+class TestWarmAmortLoop:
+    def test_frozen_build_skips_numba_cache(self):
+        """Test that a frozen build compiles without the on-disk cache, which Numba can't locate inside a bundle."""
+        pytest.importorskip("numba")
+        with (
+            patch.object(sys, "frozen", True, create=True),
+            patch("numba.njit") as njit,
+            patch("morty.main._amort_kernel"),  # Restored on exit so the mock kernel doesn't leak into later tests
+        ):
+            _warm_amort_loop()
+
+        njit.assert_called_once_with(cache=False)
+
+
+class TestAmortModel:
+    def test_only_extra_payment_is_editable(self, qapp):
+        """Test that only the "Extra Payment" column can be edited."""
+        model = AmortModel()
+        model.set_arrays(np.ones((2, 5)), ["1", "2"])
+
+        for col in range(model.columnCount()):
+            editable = bool(model.flags(model.index(0, col)) & Qt.ItemIsEditable)
+            assert editable == (col == AmortModel.EXTRA_PAYMENT_COLUMN)
+
+    def test_data_formats_lazily(self, qapp):
+        """Test display formatting and the raw edit value of the extra payment."""
+        model = AmortModel()
+        model.set_arrays(np.array([[1234.5, 2.0, 3.0, 4.0, 5.0]]), ["Jan Y1"])
+
+        assert model.index(0, 0).data() == "Jan Y1"
+        assert model.index(0, 1).data() == "1,234.50"
+        assert model.index(0, AmortModel.EXTRA_PAYMENT_COLUMN).data(Qt.EditRole) == 3.0
+
+    def test_formatted_rows_match_display(self, qapp):
+        """Test that exported rows match what the table displays."""
+        model = AmortModel()
+        model.set_arrays(np.array([[1234.5, 2.0, 3.0, 4.0, 5.0], [6.0, 7.0, 8.0, 9.0, 0.0]]), ["1", "2"])
+
+        rows = list(model.formatted_rows())
+
+        assert rows == [
+            tuple(model.index(row, col).data() for col in range(model.columnCount()))
+            for row in range(model.rowCount())
+        ]
+
+    def test_sum_of_selection_skips_month_column(self, qapp):
+        """Test that selection sums cover the selected numeric cells only."""
+        model = AmortModel()
+        model.set_arrays(np.arange(15, dtype=np.float64).reshape(3, 5), ["1", "2", "3"])
+        selection = QItemSelection(model.index(0, 0), model.index(1, 2))  # Month through Principal Payment
+        selection.select(model.index(2, 5), model.index(2, 5))  # Remaining Balance of the last row
+
+        assert model.sum_of(selection) == 0 + 1 + 5 + 6 + 14
+
+    def test_set_data_updates_extra_payment(self, qapp):
+        """Test that setData stores the extra payment and notifies listeners."""
+        model = AmortModel()
+        model.set_arrays(np.zeros((3, 5)), ["1", "2", "3"])
+        changed = []
+        model.dataChanged.connect(lambda top_left, bottom_right, roles: changed.append(top_left.row()))
+
+        assert model.setData(model.index(1, AmortModel.EXTRA_PAYMENT_COLUMN), "1,000.50")
+
+        assert model.extra_payments().tolist() == [0.0, 1000.5, 0.0]
+        assert changed == [1]
+
+    def test_set_arrays_repaints_from_first_changed_row(self, qapp):
+        """Test that only rows from the first changed one are reported as changed."""
+        model = AmortModel()
+        model.set_arrays(np.zeros((4, 5)), ["1", "2", "3", "4"])
+        changed = []
+        model.dataChanged.connect(lambda top_left, bottom_right, roles: changed.append(
+            (top_left.row(), bottom_right.row())
+        ))
+
+        model.set_arrays(np.ones((4, 5)), ["1", "2", "3", "4"], first_changed_row=2)
+
+        assert changed == [(2, 3)]
+        assert model.index(1, 1).data() == "1.00"
 
 
 class TestCurrencyDelegate:
-    def test_create_editor(self, app):
+    def test_create_editor(self, qtbot):
         """Test that the currency delegate creates a properly configured editor."""
         delegate = CurrencyDelegate()
         
         index = QModelIndex()
-        option = MagicMock()
+        option = SimpleNamespace()  # createEditor doesn't read the style option
         
         editor = delegate.createEditor(None, option, index)
+        qtbot.addWidget(editor)
         
         assert isinstance(editor, QLineEdit)
-        assert editor.validator() is not None
-        
-        assert editor.validator().validate("123.45", 0)[0] == QValidator.Acceptable
-        assert editor.validator().validate("abc", 0)[0] == QValidator.Invalid
+        assert editor.validator() is CurrencyDelegate._make_validator()
 
-    def test_set_model_data(self, app):
+    @pytest.mark.parametrize("text, expected", [
+        ("123.45", QValidator.Acceptable),
+        ("1,000.50", QValidator.Acceptable),
+        ("", QValidator.Intermediate),
+        ("abc", QValidator.Invalid),
+        ("-1", QValidator.Invalid),
+        ("1e3", QValidator.Invalid),
+        ("1.234", QValidator.Invalid),
+    ])
+    def test_validator(self, qapp, text, expected):
+        """Test which extra payment amounts the editor's validator accepts."""
+        assert CurrencyDelegate._make_validator().validate(text, 0)[0] == expected
+
+    def test_set_model_data(self, qtbot):
         """Test setting model data from editor."""
         delegate = CurrencyDelegate()
         
         editor = QLineEdit()
-        model = MagicMock()
+        qtbot.addWidget(editor)
+        model = MagicMock(spec=["setData"])  # setModelData should only need setData
         index = QModelIndex()
         
         editor.setText("123.45")
@@ -152,20 +447,18 @@ class TestCurrencyDelegate:
         model.setData.assert_called_once_with(index, "123.45", Qt.EditRole)
 
 
+@pytest.mark.gui
 class TestAmortizationCalculator:
-    def test_init(self, app):
+    def test_init(self, calc):
         """Test initialization of the calculator window."""
-        calc = AmortizationCalculator()
-        
         # Updated to check version number in title
         version = AmortizationCalculator.VERSION
         expected_title = f"Morty v{version} (your friendly amortization calculator)"
         assert calc.windowTitle() == expected_title
         assert calc.tab_widget.count() == 1
     
-    def test_add_tab(self, app):
+    def test_add_tab(self, calc):
         """Test adding new tabs."""
-        calc = AmortizationCalculator()
         initial_count = calc.tab_widget.count()
         
         calc.add_tab()
@@ -173,10 +466,8 @@ class TestAmortizationCalculator:
         assert calc.tab_widget.count() == initial_count + 1
         assert isinstance(calc.tab_widget.widget(initial_count), Plan)
 
-    def test_close_tab(self, app):
+    def test_close_tab(self, calc):
         """Test closing tabs and renaming the remaining ones."""
-        calc = AmortizationCalculator()
-        
         # Create multiple tabs for testing
         calc.add_tab()
         calc.add_tab()